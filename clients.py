@@ -0,0 +1,493 @@
+####################################################################
+# Library & Modules
+####################################################################
+
+# audio processing
+from gtts import gTTS   # remote tts engine
+
+# system level stuff
+from abc import ABC, abstractmethod   # tts engine interface
+import asyncio      # retry backoff, single-flight refresh
+import aiohttp      # pooled async http
+import heapq        # scheduler priority queue
+import itertools    # scheduler tie-breaking
+import shutil       # find local tts binaries
+from contextlib import asynccontextmanager  # scheduler slots
+from io import BytesIO  # in-memory tts audio
+from pathlib import Path    # tts cache migration
+
+# date, time, numbers
+import time         # token expiry
+
+# data analysis
+from typing import Any, AsyncIterator, Awaitable, Callable  # type hints
+
+# openai libraries
+import openai                    # error types
+from openai import AsyncOpenAI   # cleaner than manually calling openai.OpenAI()
+
+# hathor internals
+import data.config as config
+from func import FileCache
+from logs import log_sys
+
+
+####################################################################
+# Global variables
+####################################################################
+
+PRIORITY_INTERACTIVE = 0    # someone is waiting on the reply (!chatgpt, @grok, !imagine, …)
+PRIORITY_BACKGROUND = 1     # radio generation, dj intros, track name lookups
+
+
+####################################################################
+# Classes
+####################################################################
+
+class HttpClient:
+    """
+    Shared aiohttp session for every cog.
+    Keeps connections alive, limits connections per host, and retries transient failures.
+    """
+
+    RETRY_STATUS = { 429, 500, 502, 503, 504 }
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        timeout: float = 15,
+        retries: int = 3,
+        backoff: float = 0.5
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:   # created lazily, it needs a running loop
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host, keepalive_timeout=60),
+                timeout=self.timeout,
+                headers={ "User-Agent": "Hathor" }
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    async def request(self, method: str, url: str, **kwargs) -> tuple[int, Any]:
+        """
+        Sends a request, retrying connection errors, 429s and 5xxs with exponential backoff.
+        Returns the status code and the decoded json (or None if the body isn't json).
+        """
+
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.session.request(method, url, **kwargs) as response:
+                    if response.status in self.RETRY_STATUS and attempt < self.retries:
+                        try:
+                            delay = float(response.headers.get("Retry-After", self.backoff * 2 ** attempt))
+                        except ValueError:  # http-date format, just back off
+                            delay = self.backoff * 2 ** attempt
+                        log_sys.warning(f"HttpClient: {response.status} from {response.url.host}, retrying in {delay:.1f}s…")
+                        await asyncio.sleep(delay)
+                        continue
+
+                    try:
+                        data = await response.json(content_type=None)
+                    except ValueError:
+                        data = None
+                    return response.status, data
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.retries:
+                    raise
+                log_sys.warning(f"HttpClient: {e.__class__.__name__} for {url}, retrying…")
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+
+    async def get_json(self, url: str, **kwargs) -> Any:
+        """
+        GET a url and return the decoded json.
+        """
+
+        _, data = await self.request("GET", url, **kwargs)
+        return data
+
+    async def post_json(self, url: str, **kwargs) -> Any:
+        """
+        POST to a url and return the decoded json.
+        """
+
+        _, data = await self.request("POST", url, **kwargs)
+        return data
+
+
+class OpenAIScheduler:
+    """
+    Gatekeeper in front of the OpenAI client.
+    Requests wait for a concurrency slot and a rate limit token, interactive requests are let through first
+    and one slot is kept free for them, and a 429 pauses everything for the backoff period before the request is retried.
+    """
+
+    RETRY_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+    def __init__(self, concurrency: int = 4, rpm: int = 60, retries: int = 3, backoff: float = 2):
+        self.concurrency = concurrency
+        self.rate = rpm / 60        # tokens per second
+        self.burst = max(rpm / 6, 1)    # allow ~10 seconds worth of requests at once
+        self.retries = retries
+        self.backoff = backoff
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._active = 0
+        self._active_background = 0
+        self._background_limit = max(concurrency - 1, 1)     # streamed background calls must not starve chat
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()   # keeps fifo order within a priority
+        self._wake: asyncio.Event | None = None
+        self._dispatcher: asyncio.Task | None = None
+
+    def _token_delay(self) -> float:
+        """
+        Takes a rate limit token if one is available, otherwise returns how long until one is.
+        """
+
+        now = time.monotonic()
+        if now < self._paused_until:    # backing off after a 429
+            return self._paused_until - now
+
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    async def _dispatch(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+
+            while self._waiters and self._active < self.concurrency:
+                priority, _, head = self._waiters[0]
+                if head.cancelled():     # caller gave up
+                    heapq.heappop(self._waiters)
+                    continue
+                if priority >= PRIORITY_BACKGROUND and self._active_background >= self._background_limit:
+                    break   # only background work is waiting, the last slot is reserved
+
+                if delay := self._token_delay():
+                    await asyncio.sleep(delay)  # re-check afterwards, something more urgent may have arrived
+                    continue
+
+                _, _, future = heapq.heappop(self._waiters)
+                if future.cancelled():
+                    self._tokens += 1   # refund
+                    continue
+
+                self._active += 1
+                if priority >= PRIORITY_BACKGROUND:
+                    self._active_background += 1
+                future.set_result(None)
+
+    async def acquire(self, priority: int) -> None:
+        if self._wake is None:  # created lazily, it needs a running loop
+            self._wake = asyncio.Event()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._wake.set()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():    # granted just as we were cancelled
+                self.release(priority)
+            raise
+
+    def release(self, priority: int) -> None:
+        self._active -= 1
+        if priority >= PRIORITY_BACKGROUND:
+            self._active_background -= 1
+        self._wake.set()
+
+    def pause(self, delay: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        response = getattr(error, "response", None)
+        try:
+            return float(response.headers.get("retry-after"))
+        except (AttributeError, TypeError, ValueError):
+            return self.backoff * 2 ** attempt
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """
+        Holds a concurrency slot for the duration of the block (used for streamed responses).
+        """
+
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    async def run(self, priority: int, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Runs an OpenAI call once a slot is free, retrying rate limits and transient errors.
+        """
+
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.slot(priority):
+                    return await func(*args, **kwargs)
+            except self.RETRY_ERRORS as e:
+                if attempt >= self.retries:
+                    raise
+
+                delay = self._retry_delay(e, attempt)
+                if isinstance(e, openai.RateLimitError):    # everyone backs off, not just us
+                    self.pause(delay)
+                log_sys.warning(f"OpenAIScheduler: {e.__class__.__name__}, retrying in {delay:.1f}s…")
+                await asyncio.sleep(delay)
+
+    async def stream(self, priority: int, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> AsyncIterator[Any]:
+        """
+        Opens a streamed OpenAI call once a slot is free, retrying rate limits and transient errors.
+        The slot is held until the stream is exhausted, and the stream is closed if the consumer stops early.
+        """
+
+        for attempt in range(self.retries + 1):
+            await self.acquire(priority)
+            try:
+                try:
+                    response = await func(*args, **kwargs)
+                except self.RETRY_ERRORS as e:
+                    if attempt >= self.retries:
+                        raise
+
+                    delay = self._retry_delay(e, attempt)
+                    if isinstance(e, openai.RateLimitError):
+                        self.pause(delay)
+                    log_sys.warning(f"OpenAIScheduler: {e.__class__.__name__}, retrying in {delay:.1f}s…")
+                else:
+                    try:
+                        async for event in response:
+                            yield event
+                        return
+                    finally:    # abandoned (cancelled, aclose()), don't leave the connection open until gc
+                        await response.close()
+            finally:
+                self.release(priority)
+
+            await asyncio.sleep(delay)
+
+
+class SpotifyClient:
+    """
+    Spotify Web API client with an expiry-aware access token.
+    Tokens are refreshed before they expire, concurrent refreshes share a single request,
+    and a request that comes back 401 is retried once with a fresh token.
+    """
+
+    TOKEN_URL = "https://accounts.spotify.com/api/token"
+
+    def __init__(self, http: HttpClient, client_id: str, client_secret: str, margin: float = 300):
+        self.http = http
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.margin = margin    # refresh this many seconds before expiry
+        self._token = ""
+        self._expires_at = 0.0
+        self._refreshing: asyncio.Task | None = None
+
+    @property
+    def expires_in(self) -> float:
+        return self._expires_at - time.time()
+
+    async def _fetch_token(self) -> str:
+        status, data = await self.http.request("POST", self.TOKEN_URL,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data={ "grant_type": "client_credentials", "client_id": self.client_id, "client_secret": self.client_secret })
+
+        if status != 200 or not data or not data.get('access_token'):
+            raise RuntimeError(f"Spotify token request failed ({status}): {data}")
+
+        self._token = data['access_token']
+        self._expires_at = time.time() + data.get('expires_in', 3600)
+        log_sys.info(f"Generated new Spotify API Access Token (expires in {int(self.expires_in)}s).")
+        return self._token
+
+    async def refresh(self) -> str:
+        """
+        Fetches a new token. Callers that arrive during a refresh wait on the same request.
+        """
+
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._fetch_token())
+        return await asyncio.shield(self._refreshing)
+
+    async def token(self) -> str:
+        """
+        Returns a valid token, refreshing it first if it's missing or about to expire.
+        """
+
+        if not self._token or self.expires_in < self.margin:
+            return await self.refresh()
+        return self._token
+
+    async def get_json(self, url: str, **kwargs) -> Any:
+        """
+        GET a Spotify API url with auth, and return the decoded json.
+        """
+
+        headers = kwargs.pop("headers", {})
+        for attempt in range(2):
+            token = await self.token()
+            status, data = await self.http.request("GET", url, headers={ **headers, "Authorization": f"Bearer {token}" }, **kwargs)
+
+            if status == 401 and attempt == 0:  # token was revoked or expired early, retry once
+                if self._token == token:    # nobody else has refreshed it yet
+                    self._token = ""
+                continue
+
+            return data
+
+
+class TTSBackend(ABC):
+    """
+    Base text-to-speech engine. Subclasses return audio that ffmpeg can play from a pipe.
+    """
+
+    name = ""
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    async def synthesize(self, text: str, lang: str) -> bytes:
+        ...
+
+
+class GTTSBackend(TTSBackend):
+    """
+    Google Translate TTS, a network round trip per line. Returns mp3.
+    """
+
+    name = "gtts"
+
+    async def synthesize(self, text: str, lang: str) -> bytes:
+        def _synthesize() -> bytes:     # gtts does its http request while writing
+            buffer = BytesIO()
+            gTTS(text, lang=lang).write_to_fp(buffer)
+            return buffer.getvalue()
+
+        return await asyncio.to_thread(_synthesize)
+
+
+class EspeakBackend(TTSBackend):
+    """
+    Local espeak-ng synthesizer, works offline. Returns wav.
+    """
+
+    name = "espeak"
+
+    def __init__(self):
+        self.binary = shutil.which("espeak-ng") or shutil.which("espeak")
+
+    @property
+    def available(self) -> bool:
+        return self.binary is not None
+
+    async def synthesize(self, text: str, lang: str) -> bytes:
+        process = await asyncio.create_subprocess_exec(self.binary, "-v", lang, "--stdout",
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        try:
+            stdout, stderr = await process.communicate(text.encode("utf-8"))  # text on stdin, so it can't be read as a flag
+        except asyncio.CancelledError:
+            process.kill()
+            raise
+
+        if process.returncode != 0 or not stdout:
+            raise RuntimeError(f"{self.binary} exited with {process.returncode}: {stderr.decode(errors='ignore').strip()}")
+        return stdout
+
+
+class TTSClient:
+    """
+    Synthesizes speech with the configured engines, in order of preference.
+    An engine that fails or misses the deadline is skipped for the next one. Results are cached per engine,
+    and the average latency of each engine is tracked.
+    """
+
+    BACKENDS = { backend.name: backend for backend in (GTTSBackend, EspeakBackend) }
+
+    def __init__(self, engines: list[str], deadline: float = 3, cache: FileCache | None = None):
+        self.backends: list[TTSBackend] = [ self.BACKENDS[name]() for name in engines ]
+        self.deadline = deadline
+        self.cache = cache
+        self.latency: dict[str, float] = {}    # rolling average, in seconds
+
+        for backend in self.backends:
+            if not backend.available:
+                log_sys.warning(f"TTSClient: {backend.name} is not installed, skipping it.")
+
+    def _record(self, name: str, elapsed: float) -> None:
+        self.latency[name] = elapsed if name not in self.latency else 0.8 * self.latency[name] + 0.2 * elapsed
+
+    async def synthesize(self, text: str, lang: str = "en") -> bytes:
+        """
+        Returns the spoken text as audio, from the cache or the first engine that answers in time.
+        """
+
+        backends = [ b for b in self.backends if b.available ]
+        for i, backend in enumerate(backends):
+            key = FileCache.key(backend.name, lang, text)
+            if self.cache and (audio := await asyncio.to_thread(self.cache.get, key)):
+                return audio
+
+            deadline = self.deadline if i < len(backends) - 1 else None    # the last resort gets all the time it needs
+            start = time.monotonic()
+            try:
+                audio = await asyncio.wait_for(backend.synthesize(text, lang), deadline)
+            except asyncio.TimeoutError:
+                self._record(backend.name, self.deadline)
+                log_sys.warning(f"TTSClient: {backend.name} missed the {self.deadline}s deadline, falling back…")
+                continue
+            except Exception as e:
+                log_sys.warning(f"TTSClient: {backend.name} failed, falling back… ({e})")
+                continue
+
+            elapsed = time.monotonic() - start
+            self._record(backend.name, elapsed)
+            log_sys.debug(f"TTSClient: {backend.name} took {elapsed:.2f}s (average {self.latency[backend.name]:.2f}s)")
+            if self.cache:
+                await asyncio.to_thread(self.cache.add, key, audio)
+            return audio
+
+        raise RuntimeError(f"No TTS engine could synthesize the text (tried {', '.join(b.name for b in backends) or 'nothing'})")
+
+
+####################################################################
+# Clients
+####################################################################
+
+http = HttpClient()
+spotify = SpotifyClient(http, config.SPOTIFY_CLIENT_ID, config.SPOTIFY_CLIENT_SECRET)
+openai_client = AsyncOpenAI(api_key=config.OPENAI_API_KEY, max_retries=0)   # retries are handled by the scheduler
+openai_scheduler = OpenAIScheduler(config.OPENAI_CONCURRENCY, config.OPENAI_RPM)
+for file in Path("data/tts_cache").glob("*.mp3"):  # gtts entries from before the .audio suffix, the keys didn't change
+    file.replace(file.with_suffix(".audio"))
+tts = TTSClient(config.TTS_ENGINES, config.TTS_DEADLINE, FileCache(config.RADIO_TTS_CACHE_SIZE, "data/tts_cache", ".audio"))
@@ -6,26 +6,34 @@
 import discord
 from discord.ext import commands
 
+# system level stuff
+import asyncio                      # image job queue
+from collections import Counter     # image jobs per user
+
+# date, time, numbers
+import time             # stream edit cadence
+
 # data analysis
 import base64           # image data conversion
 from io import BytesIO  # raw image data handling
 import re               # regex
-
-# openai libraries
-from openai import AsyncOpenAI  # cleaner than manually calling openai.OpenAI()
+from typing import Any, AsyncIterator, Awaitable, Callable  # type hints
 
 # hathor internals
 import data.config as config # bot config
+from clients import openai_client, openai_scheduler, PRIORITY_INTERACTIVE # shared openai client
 from func import Error, ERROR_CODES, FancyError # error handling
+from func import FileCache, ResponseCache # class loading
 from func import build_embed # functions
 from logs import log_cog # logging
 
 
 ####################################################################
-# OpenAI Client
+# Global variables
 ####################################################################
 
-client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+response_cache = ResponseCache(config.CHATGPT_CACHE_SIZE, "data/chatgpt_cache.json" if config.CHATGPT_CACHE_PERSIST else None)
+image_cache = FileCache(config.GPTIMAGE_CACHE_SIZE, "data/image_cache", ".png")
 
 
 ####################################################################
@@ -35,6 +43,14 @@ client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
 class ChatGPT(commands.Cog, name="ChatGPT"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.image_queue: asyncio.Queue = asyncio.Queue()
+        self.image_jobs: dict[str, tuple[asyncio.Future, asyncio.Event]] = {}  # in-flight jobs by cache key
+        self.image_users: Counter[int] = Counter()  # in-flight jobs by user
+        self.image_workers: list[asyncio.Task] = []
+
+    async def cog_unload(self) -> None:
+        for worker in self.image_workers:
+            worker.cancel()
 
 
     ####################################################################
@@ -42,21 +58,15 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
     ####################################################################
 
     @commands.Cog.listener()
-    async def on_message(
+    async def on_grok(
         self,
         message: discord.Message
     ) -> None:
         """
-        Handles Grok's responses to messages.
+        Handles Grok's responses to messages (dispatched by Hathor.on_message for @grok and bot mentions).
         """
 
-        if not message.guild: # ignore DMs
-            return
-
-        if not message.content.lower().startswith("@grok") and not message.content.startswith(self.bot.user.mention):   # no @grok
-            return
-
-        temp_prompt = message.content.replace(self.bot.user.mention, "@grok").strip()   # replace bot mention with @grok
+        temp_prompt = message.content.replace(f"<@!{self.bot.user.id}>", "@grok").replace(self.bot.user.mention, "@grok").strip()   # replace bot mention with @grok
 
         if temp_prompt.lower() == "@grok":  # empty response, be snarky
             await message.reply("Ah, the classic 'say nothing, get nothing' approach—bold move. Try putting some words in there next time, genius. 🥱", mention_author=False); return
@@ -82,35 +92,47 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
         if not temp_prompt and not img:
             await message.reply("Ah, the classic 'say nothing, get nothing' approach—bold move. Try putting some words in there next time, genius. 🥱", mention_author=False); return
 
+        reply: discord.Message | None = None
+
+        async def render(text: str, done: bool) -> None:
+            nonlocal reply
+            content = text[:2000] if done else f"{text[:1990]} ▌"
+            if reply is None:
+                reply = await message.reply(content, mention_author=False, suppress_embeds=True)
+            else:
+                await reply.edit(content=content, suppress=True)
+
         async with message.channel.typing():
             try:
-                response_text = await self._invoke_chatgpt(
+                await self._stream_to_discord(self._invoke_chatgpt_stream(
                     "You are Grok, the snarky Twitter AI. "
                     "You are oblivious to your attitide. "
                     "Limit your response to fit in a tweet. "
                     "Be your typical rude self, but don't be too mean.",
                     temp_prompt,
                     att=img + ref_img
-                )
+                ), render)
             except Error as e:
-                await message.reply("Grok is speechless… must be on coffee break.",mention_author=False)
-                raise Error(f"on_message() -> _invoke_chatgpt():\n{e}")
-
-        await message.reply(response_text, mention_author=False, suppress_embeds=True)
+                if reply is None:
+                    await message.reply("Grok is speechless… must be on coffee break.",mention_author=False)
+                else:
+                    await reply.edit(content="Grok is speechless… must be on coffee break.")
+                raise Error(f"on_grok() -> _invoke_chatgpt_stream():\n{e}")
 
 
     ####################################################################
     # Internal: Helper Functions
     ####################################################################
 
-    async def _invoke_chatgpt(self,
+    def _build_conversation(
+        self,
         sys_content: str,
         user_content: str,
         att: list[str] | None = None
-    ) -> str:
+    ) -> tuple[bool, list[dict[str, Any]]]:
         """
-        Invokes the ChatGPT API.
-        Returns the response text as a string.
+        Helper function that builds the prompt frame for the ChatGPT API.
+        Returns whether the model is a reasoning model, and the conversation.
         """
 
         is_reasoning = True if re.search(r"^o\d+", config.CHATGPT_MODEL) else False # check if the model is a reasoning model
@@ -128,19 +150,44 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
             ]
             conversation.append({"role": "user", "content": img_url})
 
+        if not is_reasoning:
+            conversation.append({"role": "system", "content": " You have optional access to the internet."})
+
+        return is_reasoning, conversation
+
+    async def _invoke_chatgpt(self,
+        sys_content: str,
+        user_content: str,
+        att: list[str] | None = None,
+        cache_ttl: int | None = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> str:
+        """
+        Invokes the ChatGPT API.
+        Returns the response text as a string.
+        Pass cache_ttl (seconds) to reuse the response for identical prompts; interactive prompts should not.
+        Background callers should pass PRIORITY_BACKGROUND so they queue behind interactive commands.
+        """
+
+        if cache_ttl:
+            cache_key = ResponseCache.key(config.CHATGPT_MODEL, sys_content, user_content, att or [])
+            if (cached := response_cache.get(cache_key)) is not None:
+                return cached
+
+        is_reasoning, conversation = self._build_conversation(sys_content, user_content, att)
+
         try:
             if is_reasoning:
-                response = await client.chat.completions.create(
+                response = await openai_scheduler.run(priority, openai_client.chat.completions.create,
                     model=config.CHATGPT_MODEL,
                     messages=conversation,
                     temperature=config.CHATGPT_TEMPERATURE
                 )
                 
-                return response.choices[0].message.content
+                text = response.choices[0].message.content
                 
             else:
-                conversation.append({"role": "system", "content": " You have optional access to the internet."})
-                response = await client.responses.create(
+                response = await openai_scheduler.run(priority, openai_client.responses.create,
                     model=config.CHATGPT_MODEL,
                     temperature=config.CHATGPT_TEMPERATURE,
                     input=conversation,
@@ -148,11 +195,169 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
                     tools=[{"type": "web_search_preview"}])
                 
 
-                return response.output[-1].content[0].text
+                text = response.output[-1].content[0].text
 
         except Exception as e:
             raise Error(f"_invoke_chatgpt():\n{e}")
 
+        if cache_ttl and text:
+            response_cache.add(cache_key, text, cache_ttl)
+
+        return text
+
+    async def _invoke_chatgpt_stream(self,
+        sys_content: str,
+        user_content: str,
+        att: list[str] | None = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> AsyncIterator[str]:
+        """
+        Invokes the ChatGPT API in streaming mode.
+        Yields the response text in chunks as they arrive.
+        """
+
+        is_reasoning, conversation = self._build_conversation(sys_content, user_content, att)
+
+        try:
+            if is_reasoning:
+                stream = openai_scheduler.stream(priority, openai_client.chat.completions.create,
+                    model=config.CHATGPT_MODEL,
+                    messages=conversation,
+                    temperature=config.CHATGPT_TEMPERATURE,
+                    stream=True
+                )
+
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+            else:
+                stream = openai_scheduler.stream(priority, openai_client.responses.create,
+                    model=config.CHATGPT_MODEL,
+                    temperature=config.CHATGPT_TEMPERATURE,
+                    input=conversation,
+                    tool_choice= "auto",
+                    tools=[{"type": "web_search_preview"}],
+                    stream=True)
+
+                async for event in stream:
+                    if event.type == "response.output_text.delta":
+                        yield event.delta
+
+        except Exception as e:
+            raise Error(f"_invoke_chatgpt_stream():\n{e}")
+
+    async def _invoke_chatgpt_lines(self,
+        sys_content: str,
+        user_content: str,
+        att: list[str] | None = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> AsyncIterator[str]:
+        """
+        Invokes the ChatGPT API in streaming mode.
+        Yields each complete, non-empty line of the response as soon as it arrives.
+        """
+
+        buffer = ""
+        async for chunk in self._invoke_chatgpt_stream(sys_content, user_content, att, priority):
+            buffer += chunk
+            *lines, buffer = buffer.split('\n')
+            for line in lines:
+                if line.strip():
+                    yield line.strip()
+
+        if buffer.strip():  # last line has no trailing newline
+            yield buffer.strip()
+
+    async def _stream_to_discord(self,
+        stream: AsyncIterator[str],
+        render: Callable[[str, bool], Awaitable[None]]
+    ) -> str:
+        """
+        Consumes a streamed response and renders it progressively.
+        render(text, done) is called at most once per CHATGPT_STREAM_INTERVAL while the response arrives,
+        and once more with the full text when it's finished. Returns the full response text.
+        """
+
+        text, last_edit = "", 0.0
+        async for chunk in stream:
+            text += chunk
+            if time.monotonic() - last_edit >= config.CHATGPT_STREAM_INTERVAL:  # stay well inside discord's edit rate limit
+                await render(text, False)
+                last_edit = time.monotonic()
+
+        await render(text, True)
+        return text
+
+    async def _generate_image(
+        self,
+        user_id: int,
+        message: discord.Message,
+        title: str,
+        prompt: str,
+        key: str,
+        func: Callable[..., Awaitable[BytesIO]],
+        *args
+    ) -> BytesIO:
+        """
+        Returns the image for a cache key, generating it through the image job queue if it isn't cached.
+        Identical requests that are already in flight share the same job.
+        The placeholder message shows the queue position while the job waits for a worker.
+        """
+
+        if data := await asyncio.to_thread(image_cache.get, key):
+            return BytesIO(data)
+
+        if key not in self.image_jobs:
+            if self.image_users[user_id] >= config.GPTIMAGE_USER_LIMIT:
+                raise FancyError(ERROR_CODES['image_busy'])
+
+            future, started = asyncio.get_running_loop().create_future(), asyncio.Event()
+            self.image_jobs[key] = (future, started)
+            self.image_users[user_id] += 1
+
+            def _done(_: asyncio.Future) -> None:
+                self.image_users[user_id] -= 1
+                if self.image_users[user_id] <= 0:
+                    del self.image_users[user_id]
+            future.add_done_callback(_done)
+
+            self.image_workers = [ w for w in self.image_workers if not w.done() ]
+            while len(self.image_workers) < config.GPTIMAGE_WORKERS:  # started lazily, they need a running loop
+                self.image_workers.append(asyncio.create_task(self._image_worker()))
+            await self.image_queue.put((key, future, started, func, args))
+
+        future, started = self.image_jobs[key]
+        if not started.is_set():
+            ahead = 0   # jobs are queued in the order they were added to image_jobs
+            for other, (_, other_started) in self.image_jobs.items():
+                if other == key:
+                    break
+                ahead += not other_started.is_set()
+            await message.edit(embed=build_embed(title, f'Waiting in queue ({ahead} ahead)…', 'p', [('Prompt:', prompt, False)]))
+            await started.wait()
+            await message.edit(embed=build_embed(title, 'Generating image…', 'p', [('Prompt:', prompt, False)]))
+
+        return BytesIO(await asyncio.shield(future))  # shared with other requesters, don't cancel it for them
+
+    async def _image_worker(self) -> None:
+        """
+        Takes image jobs off the queue one at a time and caches the results.
+        """
+
+        while True:
+            key, future, started, func, args = await self.image_queue.get()
+            started.set()
+            try:
+                data = (await func(*args)).getvalue()
+                await asyncio.to_thread(image_cache.add, key, data)
+                future.set_result(data)
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                self.image_jobs.pop(key, None)
+                self.image_queue.task_done()
+
     async def _invoke_gptimage(
         self,
         prompt: str
@@ -163,7 +368,7 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
         """
 
         try:
-            response = await client.images.generate(    # send image generation request
+            response = await openai_scheduler.run(PRIORITY_INTERACTIVE, openai_client.images.generate,    # send image generation request
                 model=config.GPTIMAGE_MODEL,
                 prompt=prompt,
                 quality=config.GPTIMAGE_QUALITY
@@ -184,9 +389,9 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
         """
 
         try:
-            response = await client.images.edit(
+            response = await openai_scheduler.run(PRIORITY_INTERACTIVE, openai_client.images.edit,
                 model=config.GPTIMAGE_MODEL,
-                image=image_buffers,
+                image=[ (b.name, b.getvalue(), b.content_type) for b in image_buffers ],    # raw bytes, so a retry doesn't send an exhausted buffer
                 prompt=prompt
             )
         except Exception as e:
@@ -223,21 +428,33 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
             if a.content_type and a.content_type.startswith("image/")
         ]
 
+        overflow: discord.Message | None = None
+
+        async def render(text: str, done: bool) -> None:
+            nonlocal overflow
+            color, cursor = ('g', '') if done else ('p', ' ▌')
+
+            if len(text) + len(cursor) <= 1024:    # fits in the embed field
+                await message.edit(content=None, embed=build_embed('ChatGPT', 'txt', color, [('Prompt:', prompt, False), ('Response:', text + cursor or '…', False)]))
+                return
+
+            if overflow is None or done:
+                await message.edit(content=None, embed=build_embed('ChatGPT', 'txt', color, [('Prompt:', prompt, False), ('Response:', 'Response below (over embed limit).', False)]))
+            if overflow is None:
+                overflow = await message.reply(f"{text[:1900]}{cursor}", mention_author=False)
+            else:
+                await overflow.edit(content=f"{text[:1900]}{cursor}")
+
         try:
             async with message.channel.typing():
-                response = await self._invoke_chatgpt(
+                await self._stream_to_discord(self._invoke_chatgpt_stream(
                     "You are a discord bot. "
                     "You have access to discord's markdown formatting. "
                     "Limit response length to 900 characters.",
                     prompt, att=img
-                )
+                ), render)
         except Error as e:
             await message.edit(content=None, embed=build_embed('err', 'I ran into an issue. 😢', 'r', [('Prompt:', prompt, False), ('Error:', str(e), False)])); return
-        try:
-            await message.edit(content=None, embed=build_embed('ChatGPT', 'txt', 'g', [('Prompt:', prompt, False), ('Response:', response, False)]))
-        except:
-            await message.edit(content=None, embed=build_embed('ChatGPT', 'txt', 'g', [('Prompt:', prompt, False), ('Response:', 'Response below (over embed limit).', False)]))
-            await message.reply(f"{response[:1900]}", mention_author=False)
             
 
     @commands.command(name="gptedit")
@@ -266,17 +483,17 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
             raise FancyError(ERROR_CODES['no_image'])
 
         buffers: list[BytesIO] = []  # collect image buffers
-        for att in img:
-            data = await att.read()
+        for att, data in zip(img, await asyncio.gather(*(att.read() for att in img))):
             bio = BytesIO(data); bio.name = att.filename; bio.content_type = att.content_type
             buffers.append(bio)
 
         # send the prompt
         message = await ctx.reply(embed=build_embed('Image Edit', 'Generating edited image…', 'p', [('Prompt:', prompt, False)]), allowed_mentions=discord.AllowedMentions.none())
 
+        key = image_cache.key('edit', config.GPTIMAGE_MODEL, prompt, [ image_cache.hash(b.getvalue()) for b in buffers ])
         try:    # generate the edited image
             async with message.channel.typing():
-                response = await self._invoke_gptimage_edit(prompt, buffers)
+                response = await self._generate_image(ctx.author.id, message, 'Image Edit', prompt, key, self._invoke_gptimage_edit, prompt, buffers)
         except Exception as e:
             await message.edit(embed=build_embed('err', 'I ran into an issue. 😢', 'r', [('Prompt:', prompt, False), ('Error:', str(e), False)])); return
 
@@ -313,7 +530,8 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
                 response = await self._invoke_chatgpt(  # generate a prompt to pipe into GPT-Image
                     "Provide only the information requested. "
                     "Limit response to 800 characters.",
-                    f"Write an AI image generation prompt for the following: {prompt}"
+                    f"Write an AI image generation prompt for the following: {prompt}",
+                    cache_ttl=86400     # same prompt, same image from the image cache
                 )
         except Exception as e:
             await message.edit(content=None, embed=build_embed('err', 'I ran into an issue. 😢', 'r', [('Prompt:', prompt, False), ('Error:', str(e), False)])); return
@@ -322,7 +540,8 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
 
         try:
             async with message.channel.typing():
-                image_response = await self._invoke_gptimage(response)
+                key = image_cache.key('generate', config.GPTIMAGE_MODEL, config.GPTIMAGE_QUALITY, response)
+                image_response = await self._generate_image(ctx.author.id, message, 'ChatGPT + Image Generation', response, key, self._invoke_gptimage, response)
         except Exception as e:
             await message.edit(content=None, embed=build_embed('err', 'I ran into an issue. 😢', 'r', [('Prompt:', prompt, False), ('Error:', str(e), False)])); return
 
@@ -355,7 +574,8 @@ class ChatGPT(commands.Cog, name="ChatGPT"):
 
         try:
             async with message.channel.typing():
-                response = await self._invoke_gptimage(prompt)
+                key = image_cache.key('generate', config.GPTIMAGE_MODEL, config.GPTIMAGE_QUALITY, prompt)
+                response = await self._generate_image(ctx.author.id, message, 'Image Generation', prompt, key, self._invoke_gptimage, prompt)
         except Exception as e:
             await message.edit(embed=build_embed('err', 'I ran into an issue. 😢', 'r', [('Prompt:', prompt, False), ('Error:', str(e), False)])); return
         
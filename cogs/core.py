@@ -124,12 +124,13 @@ class Core(commands.Cog, name="Core"):
         if not ctx.invoked_subcommand:
             allstates = self.bot.settings[ctx.guild.id]
 
+            resolved = await self.bot.user_cache.resolve([ctx.guild.owner_id, *allstates.perms["user_id"]])  # owner included, for their name
             user_lines = [   # build users list
-                f"{(await self.bot.fetch_user(u)).display_name} (id:{u})"
+                f"{user.display_name if (user := resolved[u]) else 'Unknown user'} (id:{u})"
                 for u in allstates.perms["user_id"]
             ]
-            owner = await self.bot.fetch_user(ctx.guild.owner_id)    # required to get the owner's name
-            user_lines.insert(0, f"{owner.display_name} (id: {ctx.guild.owner_id})")
+            owner = resolved[ctx.guild.owner_id]
+            user_lines.insert(0, f"{owner.display_name if owner else 'Unknown user'} (id: {ctx.guild.owner_id})")
             users = "\n".join(user_lines)
 
             roles = "\n".join(   # build roles list
@@ -173,7 +174,8 @@ class Core(commands.Cog, name="Core"):
 
         allstates.perms[f"{group}_id"].append(target)
 
-        allstates._save_settings()
+        allstates.save()
+        self.bot.permissions.invalidate(ctx.guild.id)
         await ctx.reply(f"Successfully added {target} to {group}.", allowed_mentions=discord.AllowedMentions.none())
 
     @trigger_permissions.command(name="remove")
@@ -200,7 +202,8 @@ class Core(commands.Cog, name="Core"):
 
         allstates.perms[f"{group}_id"].remove(target)
 
-        allstates._save_settings()
+        allstates.save()
+        self.bot.permissions.invalidate(ctx.guild.id)
         await ctx.reply(f"Successfully removed {target} from {group}.", allowed_mentions=discord.AllowedMentions.none())
 
 
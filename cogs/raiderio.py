@@ -1,10 +1,11 @@
+import asyncio
 import discord
 from discord import app_commands
 from discord.ext import commands
-import requests
 import math
 from typing import Literal
 from urllib.parse import urlparse
+from clients import http
 from logs import log_cog
 
 # define the class
@@ -49,8 +50,7 @@ class RaiderIO(commands.Cog, name="RaiderIO"):
             # fetch mythic+ data using the raider.io api
             url = f'https://raider.io/api/v1/characters/profile?region={region}&realm={realm}&name={player}&fields=mythic_plus_scores_by_season%3Acurrent%2Cmythic_plus_best_runs%2Craid_progression'
             headers = {'User-Agent': 'Hathor'}
-            response = requests.get(url, headers=headers)
-            data = response.json()
+            data = await http.get_json(url, headers=headers)
 
             # basic player information
             output = discord.Embed(title="Player Lookup")
@@ -101,8 +101,7 @@ class RaiderIO(commands.Cog, name="RaiderIO"):
             # fetch mythic+ data using the raider.io api
             url = 'https://raider.io/api/v1/mythic-plus/affixes?region=us&locale=en'
             headers = {'User-Agent': 'Hathor'}
-            response = requests.get(url, headers=headers)
-            data = response.json()
+            data = await http.get_json(url, headers=headers)
 
             output = discord.Embed(title="Weekly Affixes")
 
@@ -191,11 +190,10 @@ class RaiderIO(commands.Cog, name="RaiderIO"):
 
         #try:
 
-        response = requests.get(pri_url, headers={'User-Agent': 'Hathor'})
-        pri_data = response.json()
-
-        response = requests.get(alt_url, headers={'User-Agent': 'Hathor'})
-        alt_data = response.json()
+        pri_data, alt_data = await asyncio.gather(
+            http.get_json(pri_url, headers={'User-Agent': 'Hathor'}),
+            http.get_json(alt_url, headers={'User-Agent': 'Hathor'})
+        )
 
         # get best keys
         for data in pri_data['mythic_plus_best_runs']:
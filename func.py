@@ -7,12 +7,22 @@ import discord
 from discord.ext import commands
 
 # system level stuff
+import asyncio                    # concurrent user lookups
+import hashlib                    # cache keys
 import json                       # json db handling
+import threading                  # file cache is used from worker threads
+from collections import OrderedDict   # lru ordering
 from typing import Any,TypedDict  # type hints
 from pathlib import Path          # pathlib
 
 # data analysis
-import random   # error flavor text randomizer
+from difflib import SequenceMatcher   # theme token typos
+import numpy as np  # theme similarity vectors
+import random       # error flavor text randomizer
+import re           # query normalization
+
+# date, time, numbers
+import time     # cache expiry
 
 # hathor internals
 import data.config as config
@@ -25,6 +35,13 @@ from logs import log_sys
 SETTINGS_FILE = Path(__file__).parent / "data/settings.json"
 LAST_STATUS = None
 
+TITLE_NOISE = re.compile(
+    r'\s*[\(\[][^\)\]]*\b(official|video|audio|lyrics?|visuali[sz]er|hd|hq|4k|remaster(ed)?|explicit|clean|mv|m/v)\b[^\)\]]*[\)\]]',
+    re.IGNORECASE
+)
+
+TITLE_FEAT = re.compile(r'\s*[\(\[]?\b(feat\.?|ft\.?|featuring)\s+[^\)\]\-–—]*[\)\]]?', re.IGNORECASE)
+
 
 ####################################################################
 # Classes
@@ -66,10 +83,255 @@ class FancyError(commands.CommandError):
         super().__init__(msg)
         self.code = msg
 
+class FileCache:
+    """
+    Bounded, content-addressed cache for generated media (images, synthesized intros), keyed on a hash of whatever produced it.
+    Files are kept on disk, the least recently used are evicted once the cache is full.
+    File I/O is blocking, so call add/get through asyncio.to_thread, the index is guarded by a lock for that.
+    """
+
+    def __init__(self, size: int, path: str, suffix: str):
+        self.size = size
+        self.path = Path(path)
+        self.suffix = suffix
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db: OrderedDict[str, Path] = OrderedDict(    # oldest first, mtime is the last use
+            (file.stem, file) for file in sorted(self.path.glob(f"*{suffix}"), key=lambda f: f.stat().st_mtime)
+        )
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        # caller holds the lock
+        while len(self._db) > self.size:
+            _, file = self._db.popitem(last=False)
+            file.unlink(missing_ok=True)
+
+    @staticmethod
+    def hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._db
+
+    def add(self, key: str, data: bytes) -> None:
+        file = self.path / f"{key}{self.suffix}"
+        file.write_bytes(data)
+        with self._lock:
+            self._db[key] = file
+            self._db.move_to_end(key)
+            self._evict()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            file = self._db.get(key)
+        if not file:
+            return None
+
+        try:
+            data = file.read_bytes()
+            file.touch()    # keep lru order across restarts
+        except FileNotFoundError:   # evicted by another thread, or removed behind our back
+            with self._lock:
+                self._db.pop(key, None)
+            return None
+
+        with self._lock:
+            if key in self._db:
+                self._db.move_to_end(key)
+        return data
+
+class IntroMixer(discord.AudioSource):
+    """
+    Plays a song with a DJ intro mixed over its first seconds, as a single source.
+    The song is ducked while the intro talks, then fades back up. Both inputs are 20ms frames of 16-bit 48kHz stereo PCM.
+    Volume is applied here rather than by a PCMVolumeTransformer, so the mix is only clipped once at its final level.
+    """
+
+    def __init__(self, song: discord.AudioSource, intro: discord.AudioSource, volume: float = 1.0, intro_volume: float = 1.0, duck: float = 0.3, fade: float = 0.5):
+        self.song = song
+        self.intro = intro
+        self.volume = volume    # song volume, can be changed while playing like PCMVolumeTransformer.volume
+        self.intro_volume = intro_volume
+        self.duck = duck    # song gain while the intro talks
+        self.step = (1 - duck) / max(fade / 0.02, 1)   # gain change per frame
+        self.gain = 1.0
+
+    def _mix(self, song: bytes, intro: bytes) -> bytes:
+        target = self.duck if intro else 1.0
+        next_gain = max(self.gain - self.step, target) if self.gain > target else min(self.gain + self.step, target)
+
+        samples = np.frombuffer(song, dtype=np.int16).astype(np.float32)
+        samples *= np.linspace(self.gain, next_gain, samples.size, endpoint=False, dtype=np.float32)   # ramp, no clicks
+        samples *= self.volume
+        self.gain = next_gain
+
+        if intro:
+            voice = np.frombuffer(intro, dtype=np.int16).astype(np.float32) * self.intro_volume
+            n = min(samples.size, voice.size)
+            samples[:n] += voice[:n]
+
+        return np.clip(samples, -32768, 32767).astype(np.int16).tobytes()
+
+    def read(self) -> bytes:
+        song = self.song.read()
+        if not song:    # song is over, the intro goes with it
+            return b""
+
+        intro = b""
+        if self.intro:
+            intro = self.intro.read()
+            if not intro:   # intro is over
+                self.intro.cleanup()
+                self.intro = None
+
+        if not intro and self.gain >= 1.0 and self.volume == 1.0:  # nothing left to mix
+            return song
+        return self._mix(song, intro)
+
+    def is_opus(self) -> bool:
+        return False
+
+    def cleanup(self) -> None:
+        self.song.cleanup()
+        if self.intro:
+            self.intro.cleanup()
+
+class NegativeCache:
+    """
+    Remembers queries and video ids that could not be used, so we don't retry them.
+    Entries are stored with a reason code and expire after their TTL. Transient failures (network, bot checks)
+    use the short transient_ttl, everything else the long ttl.
+    """
+
+    TRANSIENT = { "fetch_failed", "download_failed" }
+
+    def __init__(self, path: str = "data/negative_cache.json", ttl: int = 86400, transient_ttl: int = 900):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.transient_ttl = transient_ttl
+        self._db: dict[str, dict[str, dict[str, Any]]] = {"queries": {}, "ids": {}}
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                self._db = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._db = {"queries": {}, "ids": {}}
+
+        for section in ("queries", "ids"):
+            self._db.setdefault(section, {})
+        self.prune()
+
+    def save(self) -> None:
+        with self.path.open("w", encoding="utf-8") as f:
+            json.dump(self._db, f, ensure_ascii=False, indent=4)
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        if "://" in query:  # urls (and their video ids) are case sensitive
+            return query.strip()
+        return re.sub(r"\s+", " ", query).strip().lower()
+
+    def prune(self) -> None:
+        now = time.time()
+        for section in self._db.values():
+            for key in [k for k, v in section.items() if v["expires"] <= now]:
+                del section[key]
+        self.save()
+
+    def _add(self, section: str, key: str, reason: str, ttl: int | None) -> None:
+        if ttl is None:
+            ttl = self.transient_ttl if reason in self.TRANSIENT else self.ttl
+        self._db[section][key] = { "reason": reason, "expires": time.time() + ttl }
+        self.save()
+
+    def _get(self, section: str, key: str) -> str | None:
+        entry = self._db[section].get(key)
+        if not entry:
+            return None
+
+        if entry["expires"] <= time.time():  # expired, forget about it
+            del self._db[section][key]
+            self.save()
+            return None
+
+        return entry["reason"]
+
+    def add_query(self, query: str, reason: str, ttl: int | None = None) -> None:
+        self._add("queries", self.normalize(query), reason, ttl)
+
+    def add_id(self, video_id: str, reason: str, ttl: int | None = None) -> None:
+        self._add("ids", str(video_id), reason, ttl)
+
+    def get_query(self, query: str) -> str | None:
+        return self._get("queries", self.normalize(query))
+
+    def get_id(self, video_id: str) -> str | None:
+        return self._get("ids", str(video_id))
+
+    def __contains__(self, query: str) -> bool:
+        return self.get_query(query) is not None
+
+class PermissionResolver:
+    """
+    Decides who can use elevated commands, and which channels the bot listens in, from the gateway cache only (no REST calls).
+    Decisions are memoized per (guild, user) and dropped when the member's roles, the guild owner,
+    or the guild's permission settings change.
+    """
+
+    def __init__(self):
+        self._sets: dict[int, tuple[frozenset[int], frozenset[int], frozenset[int]]] = {}   # guild -> (user ids, role ids, channel ids)
+        self._cache: dict[tuple[int, int], tuple[frozenset[int], bool]] = {}  # (guild, user) -> (role ids, allowed)
+
+    def allowed(self, member: discord.Member, perms: dict[str, list[int]]) -> bool:
+        guild_id = member.guild.id
+        roles = frozenset(role.id for role in member.roles)
+
+        cached = self._cache.get((guild_id, member.id))
+        if cached and cached[0] == roles:   # stale if the member's roles changed under us
+            return cached[1]
+
+        users, allowed_roles, _ = self._get_sets(guild_id, perms)
+
+        allowed = (
+            member.id == config.BOT_ADMIN
+            or member.id == member.guild.owner_id
+            or member.id in users
+            or not allowed_roles.isdisjoint(roles)
+        )
+        self._cache[(guild_id, member.id)] = (roles, allowed)
+        return allowed
+
+    def _get_sets(self, guild_id: int, perms: dict[str, list[int]]) -> tuple[frozenset[int], frozenset[int], frozenset[int]]:
+        if guild_id not in self._sets:
+            self._sets[guild_id] = (frozenset(perms['user_id']), frozenset(perms['role_id']), frozenset(perms['channel_id']))
+        return self._sets[guild_id]
+
+    def channel_allowed(self, guild_id: int, channel_id: int, perms: dict[str, list[int]]) -> bool:
+        channels = self._get_sets(guild_id, perms)[2]
+        return not channels or channel_id in channels   # no channels set means every channel
+
+    def invalidate(self, guild_id: int, user_id: int | None = None) -> None:
+        if user_id is not None:
+            self._cache.pop((guild_id, user_id), None)
+            return
+
+        self._sets.pop(guild_id, None)
+        for key in [ k for k in self._cache if k[0] == guild_id ]:
+            del self._cache[key]
+
 class RadioPlaylists:
     def __init__(self, path: str = "data/radio_playlists.json"):
         self.path = Path(path)
         self._db: dict[str, list[str]] = {}
+        self._index: ThemeIndex | None = None
         self.load()
 
     def load(self) -> None:
@@ -79,6 +341,7 @@ class RadioPlaylists:
         except (FileNotFoundError, json.JSONDecodeError):
             self._db = {}
             self.save()
+        self._index = None
 
     def save(self) -> None:
         with self.path.open("w", encoding="utf-8") as f:
@@ -86,20 +349,34 @@ class RadioPlaylists:
 
     def add(self, playlist_name: str, songs: list[str]) -> None:
         self._db[playlist_name] = songs
+        self._index = None
         self.save()
 
     def remove(self, playlist_name: str) -> bool:
         if playlist_name in self._db:
             del self._db[playlist_name]
+            self._index = None
             self.save()
             return True
         return False
 
+    def find_similar(self, theme: str, threshold: float) -> str | None:
+        """
+        Returns the name of an existing station that is a near-duplicate of theme, if any.
+        """
+
+        if self._index is None:     # rebuilt lazily after any change
+            self._index = ThemeIndex(list(self._db.keys()))
+
+        match = self._index.match(theme, threshold)
+        return match[0] if match else None
+
     def __getitem__(self, playlist_name: str) -> list[str]:
         return self._db[playlist_name]
 
     def __setitem__(self, playlist_name: str, value: list[str]) -> None:
         self._db[playlist_name] = value
+        self._index = None
         self.save()
 
     def __contains__(self, playlist_name: str) -> bool:
@@ -111,6 +388,63 @@ class RadioPlaylists:
     def all(self) -> dict[str, list[str]]:
         return self._db
 
+class ResponseCache:
+    """
+    Bounded LRU cache for ChatGPT responses, keyed on the full prompt.
+    Each entry has its own TTL. If a path is given, entries are also kept on disk across restarts.
+    """
+
+    def __init__(self, size: int = 512, path: str | None = None):
+        self.size = size
+        self.path = Path(path) if path else None
+        self._db: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.load()
+
+    def load(self) -> None:
+        if not self.path:
+            return
+
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+
+        now = time.time()
+        self._db = OrderedDict((k, v) for k, v in data.items() if v["expires"] > now)
+        while len(self._db) > self.size:
+            self._db.popitem(last=False)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+
+        with self.path.open("w", encoding="utf-8") as f:
+            json.dump(self._db, f, ensure_ascii=False, indent=4)
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def add(self, key: str, response: str, ttl: int) -> None:
+        self._db[key] = { "response": response, "expires": time.time() + ttl }
+        self._db.move_to_end(key)
+        while len(self._db) > self.size:    # evict least recently used
+            self._db.popitem(last=False)
+        self.save()
+
+    def get(self, key: str) -> str | None:
+        entry = self._db.get(key)
+        if not entry:
+            return None
+
+        if entry["expires"] <= time.time():
+            del self._db[key]
+            return None
+
+        self._db.move_to_end(key)
+        return entry["response"]
+
 class Settings:
     def __init__(self, guild_id: int):
         self.guild_id = guild_id
@@ -264,40 +598,190 @@ class SongHistory:
     def all(self) -> dict[str, list[str]]:
         return self._db
 
+class ThemeIndex:
+    """
+    Character n-gram TF-IDF index over radio station names.
+    Used to map near-duplicate themes ("80s synthwave", "synthwave 80's") onto an existing station.
+    The n-gram cosine only shortlists candidates; the score is how much of each side's tokens the other side covers,
+    so a theme with an extra qualifier ("90s country") doesn't collapse into a generic station ("country").
+    """
+
+    def __init__(self, themes: list[str], n: int = 3):
+        self.themes = themes
+        self.n = n
+        self.keys = [self.normalize(theme) for theme in themes]
+
+        grams = [self._ngrams(key) for key in self.keys]
+        self.vocab = { gram: i for i, gram in enumerate(sorted({g for row in grams for g in row})) }
+
+        counts = np.zeros((len(self.keys), len(self.vocab)), dtype=np.float32)
+        for row, row_grams in enumerate(grams):
+            for gram in row_grams:
+                counts[row, self.vocab[gram]] += 1
+
+        doc_freq = (counts > 0).sum(axis=0)
+        self.idf = np.log((1 + len(self.keys)) / (1 + doc_freq)) + 1
+        self.idf_unseen = np.log(1 + len(self.keys)) + 1  # weight for grams no station has
+
+        weighted = counts * self.idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        self.matrix = weighted / np.where(norms == 0, 1, norms)
+
+    @staticmethod
+    def normalize(theme: str) -> str:
+        """
+        Lowercases, drops apostrophes and punctuation, and sorts tokens so word order doesn't matter.
+        """
+
+        theme = re.sub(r"['’`]", "", theme.lower())
+        return " ".join(sorted(re.findall(r"\w+", theme)))
+
+    @staticmethod
+    def _coverage(tokens: list[str], other: list[str]) -> float:
+        """
+        Fraction of the characters in tokens that have a counterpart in other: the same token, a compound of
+        other tokens or part of one ("hiphop" / "hip hop"), or a typo of a longer token ("synthwav" / "synthwave").
+        """
+
+        def _compound(token: str) -> bool:
+            ends = {0}  # prefixes of token we can build out of other tokens
+            for i in range(len(token)):
+                if i in ends:
+                    ends.update(i + len(o) for o in other if o and token.startswith(o, i))
+            return len(token) in ends
+
+        total = sum(len(t) for t in tokens)
+        matched = sum(
+            len(t) for t in tokens
+            if t in other or _compound(t) or any(t in o for o in other)
+            or any(min(len(t), len(o)) >= 5 and SequenceMatcher(None, t, o).ratio() >= 0.8 for o in other)
+        )
+        return matched / total if total else 0.0
+
+    def _ngrams(self, key: str) -> list[str]:
+        padded = f" {key} "
+        return [padded[i:i + self.n] for i in range(max(len(padded) - self.n + 1, 1))]
+
+    def match(self, theme: str, threshold: float) -> tuple[str, float] | None:
+        """
+        Returns the closest (station, score) at or above threshold, or None.
+        The score is the token coverage of the weaker direction, over the top candidates by n-gram cosine.
+        """
+
+        if not self.themes:
+            return None
+
+        key = self.normalize(theme)
+        if key in self.keys:    # same tokens, different spelling or order
+            return self.themes[self.keys.index(key)], 1.0
+
+        query = np.zeros(len(self.vocab), dtype=np.float32)
+        unseen: dict[str, int] = {}
+        for gram in self._ngrams(key):
+            if gram in self.vocab:
+                query[self.vocab[gram]] += 1
+            else:
+                unseen[gram] = unseen.get(gram, 0) + 1
+
+        query *= self.idf
+        norm = np.sqrt(np.dot(query, query) + sum((c * self.idf_unseen) ** 2 for c in unseen.values()))   # unseen grams still count against similarity
+        if norm == 0:
+            return None
+
+        scores = self.matrix @ (query / norm)
+        tokens = key.split()
+        best, best_score = None, 0.0
+        for i in np.argsort(scores)[::-1][:3]:  # shortlist
+            station = self.keys[i].split()
+            score = min(self._coverage(tokens, station), self._coverage(station, tokens))   # extra words on either side count against it
+            if score > best_score:
+                best, best_score = int(i), score
+
+        if best is None or best_score < threshold:
+            return None
+        return self.themes[best], best_score
+
+class UserCache:
+    """
+    Turns user ids into users: gateway cache first, then a bounded TTL cache, then concurrent REST lookups.
+    Ids that don't exist are remembered as None for the same TTL.
+    """
+
+    def __init__(self, bot: commands.Bot, size: int = 1024, ttl: int = 3600, concurrency: int = 5):
+        self.bot = bot
+        self.size = size
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self._db: OrderedDict[int, tuple[discord.User | None, float]] = OrderedDict()
+
+    def _get(self, user_id: int) -> tuple[bool, discord.User | None]:
+        if user := self.bot.get_user(user_id):  # gateway cache
+            return True, user
+
+        entry = self._db.get(user_id)
+        if not entry:
+            return False, None
+
+        if entry[1] <= time.time():
+            del self._db[user_id]
+            return False, None
+
+        self._db.move_to_end(user_id)
+        return True, entry[0]
+
+    def _add(self, user_id: int, user: discord.User | None) -> None:
+        self._db[user_id] = (user, time.time() + self.ttl)
+        self._db.move_to_end(user_id)
+        while len(self._db) > self.size:    # evict least recently used
+            self._db.popitem(last=False)
+
+    async def resolve(self, user_ids: list[int]) -> dict[int, discord.User | None]:
+        """
+        Returns a user (or None if it can't be found) for every id. Cache misses are fetched concurrently.
+        """
+
+        users: dict[int, discord.User | None] = {}
+        missing: list[int] = []
+        for user_id in dict.fromkeys(user_ids):  # dedupe, keep order
+            found, user = self._get(user_id)
+            if found:
+                users[user_id] = user
+            else:
+                missing.append(user_id)
+
+        semaphore = asyncio.Semaphore(self.concurrency)  # don't spend the whole rest budget at once
+
+        async def _fetch(user_id: int) -> None:
+            async with semaphore:
+                try:
+                    user = await self.bot.fetch_user(user_id)
+                except discord.NotFound:
+                    user = None
+                except discord.HTTPException:   # transient, don't remember it
+                    users[user_id] = None
+                    return
+            self._add(user_id, user)
+            users[user_id] = user
+
+        await asyncio.gather(*(_fetch(user_id) for user_id in missing))
+        return users
+
 
 ###############################################################
 # Functions
 ###############################################################
 
-async def _check_permissions(
+def _check_permissions(
     bot: commands.Bot,
-    guild_id: int,
-    user_id: int,
-    user_roles: list[discord.Role]
+    member: discord.Member
 ) -> bool:
     """
     Check if a user has permissions to use elevated commands.
     """
 
-    allstates = bot.settings[guild_id]
-    guild = await bot.fetch_guild(guild_id) # required to get the owner_id
-    owner = await bot.fetch_user(guild.owner_id)
+    allstates = bot.settings[member.guild.id]
+    return bot.permissions.allowed(member, allstates.perms)
 
-    if user_id == config.BOT_ADMIN:
-        return True
-    
-    elif user_id == owner.id:
-        return True
-    
-    elif user_id in allstates.perms['user_id']:
-        return True
-    
-    elif any(role.id in allstates.perms['role_id'] for role in user_roles):
-        return True
-    
-    else:
-        return False
-    
 def build_embed(
     title: str,
     description: str,
@@ -339,6 +823,62 @@ async def _get_random_radio_intro(bot: commands.Bot, guild_name: str, title: str
         intro = intro.replace(placeholder, value)
     return intro
 
+def _parse_artist_title(info: dict[str, Any]) -> tuple[str | None, str | None, float]:
+    """
+    Guesses the artist and title of a track from yt-dlp metadata, without asking ChatGPT.
+    Returns (artist, title, confidence), where confidence is 0-1.
+    """
+
+    def _clean(text: str) -> str:
+        text = TITLE_NOISE.sub('', text)    # (Official Video), [HD], etc
+        text = TITLE_FEAT.sub('', text)     # feat. / ft. tags
+        return text.strip(' -–—|"\'')
+
+    title = info.get('title') or ''
+    uploader = info.get('uploader') or info.get('channel') or ''
+
+    if info.get('track') and (info.get('artist') or info.get('creator')): # youtube music / auto-generated tags
+        artist = (info.get('artist') or info['creator']).split(',')[0]
+        return _clean(artist), _clean(info['track']), 1.0
+
+    if uploader.endswith(' - Topic'):   # auto-generated "Artist - Topic" channels upload bare titles
+        return uploader[:-len(' - Topic')].strip(), _clean(title), 0.95
+
+    parts = re.split(r'\s+[-–—]\s+', title, maxsplit=1)
+    if len(parts) == 2:     # "Artist - Title (Official Video)"
+        artist, song = _clean(parts[0]), _clean(parts[1])
+        if artist and song:
+            channel = re.sub(r'(?i)(vevo|official|music|\s)+$', '', uploader).lower().replace(' ', '')
+            if channel and channel == artist.lower().replace(' ', ''):  # the artist's own channel
+                return artist, song, 0.95
+            if channel and channel == song.lower().replace(' ', ''):    # "Title - Artist" on the artist's channel
+                return song, artist, 0.9
+            return artist, song, 0.6   # could be anything with a dash ("Lecture 5 - Thermodynamics"), let ChatGPT decide
+
+    if uploader.lower().endswith('vevo'):  # "ArtistVEVO" with a bare title
+        return uploader[:-4].strip(), _clean(title), 0.7
+
+    return None, None, 0.0
+
+def _normalize_song(song: str) -> tuple[str, str] | None:
+    """
+    Normalizes an 'Artist - Song Title' string into an (artist, title) key for de-duplication.
+    Returns None if the string isn't in that format.
+    """
+
+    song = re.sub(r'^\s*\d+[.)]\s*', '', song).strip().strip('"\'')  # drop numbering and quotes
+    if ' - ' not in song:
+        return None
+
+    artist, title = song.split(' - ', 1)
+    artist = re.sub(r'^the\s+', '', artist.lower())
+    title = re.sub(r'\s*[\(\[].*?[\)\]]', '', title.lower())    # drop (feat. …), [remastered], etc
+    artist, title = (re.sub(r'[^\w]+', ' ', x).strip() for x in (artist, title))
+
+    if not artist or not title:
+        return None
+    return artist, title
+
 async def _set_profile_status(
         bot: commands.Bot,
         activity: str | None = None
@@ -409,6 +949,7 @@ ERROR_CODES = {
     "bot_no_voice": "I am not in a voice channel",
     "bump_short": "Queue too short",
     "duplicate_song": "This song already exists in the destination",
+    "image_busy": "You already have images generating, wait for them to finish",
     "message_short": "Message is too short",
     "no_image": "No images attached",
     "no_playing": "There is nothing playing",
@@ -426,6 +967,17 @@ ERROR_CODES = {
     "wrong_fuse": "That station is not fused"
 }
 
+RADIO_SHARD_FOCUS = [
+    "the most popular and well-known songs",
+    "deep cuts and album tracks",
+    "older songs and classics",
+    "newer and recent songs",
+    "underrated and lesser-known artists",
+    "high energy songs",
+    "mellow and slower songs",
+    "fan favorites and live staples",
+]
+
 RADIO_INTROS = [
     "Ladies and gentlemen, hold onto your seats because we're about to unveil the magic of %TITLE% by %ARTIST%. Only here at %SERVER% radio.",
     "Turning it up to 11! brace yourselves for %ARTIST%'s masterpiece %TITLE%. Here on %SERVER% radio.",
@@ -465,7 +1017,7 @@ RADIO_INTROS = [
 def requires_author_perms():
     async def predicate(message: discord.Message):
 
-        allowed = await _check_permissions(message.bot, message.guild.id, message.author.id, message.author.roles)
+        allowed = _check_permissions(message.bot, message.author)
 
         if not allowed:
             raise FancyError(ERROR_CODES["author_perms"])
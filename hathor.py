@@ -21,17 +21,18 @@ from rich.markup import escape
 
 # hathor internals
 import data.config as config
+from clients import http # shared http client
 from func import Error, ERROR_CODES, FancyError # error handling
-from func import Settings # class loading
+from func import PermissionResolver, Settings, UserCache # class loading
 from func import build_embed # functions
-from logs import log_sys, log_msg # logging
+from logs import Lazy, log_sys, log_msg # logging
 
 
 ####################################################################
 # Mute regular INFO logging
 ####################################################################
 
-log_names = [ "discord.player", "discord.voice_client", "pylast", "requests", "urllib3" ]
+log_names = [ "discord.player", "discord.voice_client", "pylast", "requests", "urllib3", "aiohttp" ]
 
 for logger_name in log_names:
     logger = logging.getLogger(logger_name)
@@ -51,7 +52,7 @@ def validate_config() -> None:
     missing = []
     pattern = re.compile(r"^[A-Z][A-Z0-9_]+$")
     for name, val in inspect.getmembers(config):
-        if pattern.match(name) and not name.startswith("LASTFM_"):
+        if pattern.match(name) and not name.startswith("LASTFM_") and name != "YOUTUBE_API_KEY":   # optional
             if not val and val != 0:
                 missing.append(name)
     if missing:
@@ -86,7 +87,12 @@ class Hathor(commands.Bot):
             if p.stem != "__init__" # ignore __init__.py
         ]
 
+        self.prefixes = tuple(config.BOT_PREFIX) if isinstance(config.BOT_PREFIX, (list, tuple)) else (config.BOT_PREFIX,)
+        self.mentions: tuple[str, ...] = ()   # set once we know who we are
+
         self.settings: dict[int, Settings] = {}
+        self.permissions = PermissionResolver()
+        self.user_cache = UserCache(self)
 
         self._patch_context()   # load patcher for embed logging
 
@@ -97,12 +103,16 @@ class Hathor(commands.Bot):
         source_send = Context.send
 
         async def send(self, *a, **kw):
-            if kw.get("embed"):
-                log_msg.info(f"[dark_violet]{self.bot.user}[/]@{self.guild.name}#{self.channel.name}:\n{kw['embed'].to_dict()}")
+            if kw.get("embed") and log_msg.isEnabledFor(logging.INFO):
+                log_msg.info("[dark_violet]%s[/]@%s#%s:\n%s", self.bot.user, self.guild.name, self.channel.name, Lazy(kw['embed'].to_dict))   # serialized on the log thread
             return await source_send(self, *a, **kw)
 
         Context.send = send
 
+    async def close(self):  # release pooled connections on shutdown
+        await http.close()
+        await super().close()
+
     async def setup_hook(self): # load extensions
         for ext in self.cog_list:
             await self.load_extension(ext)
@@ -125,6 +135,7 @@ class Hathor(commands.Bot):
         ###
 
         log_sys.info(f"connected as [dark_violet]{self.user}[/].")   # log connection to console
+        self.mentions = (f"<@{self.user.id}>", f"<@!{self.user.id}>")
 
         for guild in self.guilds:
             self.settings.setdefault(guild.id, Settings(guild.id))
@@ -160,24 +171,49 @@ class Hathor(commands.Bot):
         allstates.save()
         
 
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild) -> None:
+        if before.owner_id != after.owner_id:   # ownership transferred
+            self.permissions.invalidate(after.id)
+
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self.permissions.invalidate(role.guild.id)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        if before.roles != after.roles:
+            self.permissions.invalidate(after.guild.id, after.id)
+
+    async def on_member_remove(self, member: discord.Member) -> None:
+        self.permissions.invalidate(member.guild.id, member.id)
+
     async def on_message(self, message: discord.Message) -> None:
         """
         Runs when a message is sent in a server or DM.
+        Messages are classified in one cheap pass, and only commands, @grok and foxtest go any further.
         """
 
-        if message.author == self.user or message.author.bot or not message.guild or not message.content: # ignore [self, bot, dm, empty]
+        if message.author.bot or not message.guild or not message.content: # ignore [self, bot, dm, empty]
+            return
+
+        kind = self._classify_message(message.content)
+
+        if (kind or config.LOG_MESSAGE_SAMPLE and random.random() < config.LOG_MESSAGE_SAMPLE) and log_msg.isEnabledFor(logging.INFO):
+            log_msg.info(f"[dark_violet]{message.author}[/]@{message.guild.name}#{message.channel.name}: {escape(message.content)}")
+
+        if not kind:    # chatter
             return
 
         allstates = self.settings[message.guild.id]
-        log_msg.info(f"[dark_violet]{message.author}[/]@{message.guild.name}#{message.channel.name}: {escape(message.content)}")
-        
-        if len(allstates.perms['channel_id']) > 0 and message.channel.id not in allstates.perms['channel_id']:
+        if not self.permissions.channel_allowed(message.guild.id, message.channel.id, allstates.perms):
             return
 
-        if message.content.lower() == "foxtest":    # test message
-            await message.reply(f'The quick brown fox jumps over the lazy dog 1234567890 ({self.latency * 1000:.2f}ms)')
+        if kind == "command":
+            await self.process_commands(message) # required to process @bot.command
 
-        await self.process_commands(message) # required to process @bot.command
+        elif kind == "grok":
+            self.dispatch("grok", message)  # handled by the ChatGPT cog
+
+        elif kind == "foxtest":    # test message
+            await message.reply(f'The quick brown fox jumps over the lazy dog 1234567890 ({self.latency * 1000:.2f}ms)')
 
     async def on_voice_state_update(self, author: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> None:
         if before.channel is None and after.channel is not None: # joined
@@ -192,6 +228,19 @@ class Hathor(commands.Bot):
     # Functions
     ####################################################################
 
+    def _classify_message(self, content: str) -> str | None:
+        """
+        Returns what a message is for ("command", "grok", "foxtest"), or None for regular chatter.
+        """
+
+        if content.startswith(self.prefixes):
+            return "command"
+        if content[:5].lower() == "@grok" or content.startswith(self.mentions):
+            return "grok"
+        if len(content) == 7 and content.lower() == "foxtest":
+            return "foxtest"
+        return None
+
     async def _join_voice(self, ctx: commands.Context):
         allstates = self.settings[ctx.guild.id]
 
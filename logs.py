@@ -2,28 +2,93 @@
 # Library & Modules
 ####################################################################
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 from rich.logging import RichHandler
+from rich.text import Text
+
+# hathor internals
+import data.config as config
+
+
+####################################################################
+# Classes
+####################################################################
+
+class JsonFormatter(logging.Formatter):
+    """
+    One compact json object per line, with rich markup stripped. For production log collectors.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        try:
+            message = Text.from_markup(message).plain
+        except Exception:   # not valid markup, keep it as is
+            pass
+
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": message
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class Lazy:
+    """
+    Defers an expensive log argument (like embed.to_dict) until the record is formatted on the listener thread.
+    Records below the logger's level are never formatted, so the value is never built.
+    """
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.func(*self.args))
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the listener thread untouched, so formatting doesn't happen on the event loop.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 ####################################################################
 # Logging Setup
 ####################################################################
 
-rich_handler = RichHandler(
-    rich_tracebacks=True,
-    markup=True,
-    show_path=False,
-    show_time=True,
-    show_level=True
-)
+if config.LOG_FORMAT == "json":
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter())
+else:
+    handler = RichHandler(
+        rich_tracebacks=True,
+        markup=True,
+        show_path=False,
+        show_time=True,
+        show_level=True
+    )
+    handler.setFormatter(logging.Formatter(fmt="%(message)s", datefmt="%m/%d %H:%M:%S"))
 
-formatter = logging.Formatter(fmt="%(message)s", datefmt="%m/%d %H:%M:%S")
-rich_handler.setFormatter(formatter)
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)   # formats and writes on a background thread
+listener.start()
+atexit.register(listener.stop)  # flush what's left on shutdown
 
 logging.basicConfig(
     level="INFO",
-    handlers=[rich_handler],
+    handlers=[QueueHandler(log_queue)],
 )
 
 
@@ -33,4 +98,4 @@ logging.basicConfig(
 
 log_cog = logging.getLogger('discord.cogs')
 log_msg = logging.getLogger('message')
-log_sys = logging.getLogger('system')
\ No newline at end of file
+log_sys = logging.getLogger('system')